@@ -7,6 +7,7 @@ import re
 import os
 
 from dateutil.parser import parse
+from functools import lru_cache
 from pprint import PrettyPrinter
 
 try:
@@ -74,6 +75,9 @@ def md_print(markdown_text):
         print(markdown_text)
 
 
+# The same timestamps turn up repeatedly (created/updated, comment
+# and field dates) and parsing them is comparatively expensive.
+@lru_cache(maxsize=4096)
 def pretty_date(date_str):
     date_obj = parse(date_str)
     return date_obj.astimezone().strftime('%F %T %Z')
@@ -14,7 +14,7 @@ from trolly.jboard import JiraProject
 from trolly.decor import md_print, pretty_date, color_string, hbar_under, hbar_over, nym, vsep_print, vseparator
 from trolly.decor import pretty_print  # NOQA
 from trolly.config import get_config
-from trolly.jira_fields import apply_field_renderers, render_issue_fields, max_field_width
+from trolly.jira_fields import apply_field_renderers, render_issue_fields, render_issues, render_fields, rendered_field_width
 
 
 def move(args):
@@ -205,7 +205,7 @@ def issue_fields(args):
 
     field = None
     for _field in fields:
-        if args.name not in (field, fields[_field]['name'], nym(fields[_field]['name']), fields[_field]['fieldId'], nym(fields[_field]['fieldId'])):
+        if args.name not in (_field, fields[_field]['name'], nym(fields[_field]['name']), fields[_field]['fieldId'], nym(fields[_field]['fieldId'])):
             continue
         field = fields[_field]
         break
@@ -604,10 +604,11 @@ def print_subtasks(issue):
 
 def print_issue(project, issue_obj, verbose=False, no_comments=False):
     issue = issue_obj.raw['fields']
-    lsize = max(len(issue_obj.raw['key']), max_field_width(issue, verbose, project.allow_code))
+    rendered = render_fields(issue, verbose, project.allow_code)
+    lsize = max(len(issue_obj.raw['key']), rendered_field_width(rendered))
 
     vsep_print(' ', issue_obj.raw['key'], lsize, issue['summary'])
-    render_issue_fields(issue, verbose, project.allow_code, lsize)
+    render_issue_fields(issue, verbose, project.allow_code, lsize, rendered)
 
     if verbose:
         vsep_print(' ', 'ID', lsize, issue_obj.raw['id'])
@@ -657,6 +658,10 @@ def cat(args):
             return (127, False)
         issues.append(issue)
 
+    if args.fields_only:
+        render_issues([issue.raw for issue in issues], args.verbose, args.project.allow_code)
+        return (0, False)
+
     for issue in issues:
         print_issue(args.project, issue, args.verbose, args.no_comments)
     return (0, False)
@@ -781,6 +786,7 @@ def create_parser():
     cmd = parser.command('cat', help='Print issue(s)', handler=cat)
     cmd.add_argument('-v', '--verbose', action='store_true', help='Verbose output')
     cmd.add_argument('-N', '--no-comments', action='store_true', default=False, help='Skip comments')
+    cmd.add_argument('-F', '--fields-only', action='store_true', default=False, help='Only print key, summary and fields, aligned across issues')
     cmd.add_argument('issue_id', nargs='+', help='Target issue(s)', type=str.upper)
 
     cmd = parser.command('view', help='Display issue in browser', handler=view_issue)
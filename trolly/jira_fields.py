@@ -1,7 +1,9 @@
 #!/usr/bin/python3
 
-import re  # NOQA
-from collections import OrderedDict
+import re  # NOQA - available to custom field code snippets
+from functools import partial
+from operator import itemgetter
+from types import MappingProxyType
 from trolly.decor import pretty_date, color_string, vsep_print
 
 
@@ -9,8 +11,9 @@ from trolly.decor import pretty_date, color_string, vsep_print
 # Field rendering functions. Return a string, or None if you want the field
 # suppressed.
 #
-def _list_of_key(field, key):
-    return ', '.join([item[key] for item in field])
+_get_name = itemgetter('name')
+_get_value = itemgetter('value')
+_get_email = itemgetter('emailAddress')
 
 
 def string(field, fields):
@@ -30,11 +33,11 @@ def name(field, fields):
 
 
 def user(field, fields):
-    return field['displayName'] + ' - ' + field['emailAddress']
+    return f"{field['displayName']} - {field['emailAddress']}"
 
 
 def user_list(field, fields):
-    return _list_of_key(field, 'emailAddress')
+    return ', '.join(map(_get_email, field))
 
 
 def array(field, fields):
@@ -42,20 +45,28 @@ def array(field, fields):
 
 
 def value_list(field, fields):
-    return _list_of_key(field, 'value')
+    return ', '.join(map(_get_value, field))
 
 
 def name_list(field, fields):
-    return _list_of_key(field, 'name')
+    return ', '.join(map(_get_name, field))
 
 
 def date(field, fields):
     return pretty_date(field)
 
 
+_undefined_names = frozenset(('Undefined', 'undefined'))
+_zero_votes = frozenset((0, '0'))
+
+
 def _ratio(field, fields):
-    if int(field) < 0:
-        return None
+    if isinstance(field, int):
+        if field < 0:
+            return None
+    elif not (isinstance(field, str) and field.isdecimal()):
+        if int(field) < 0:
+            return None
     return str(field)
 
 
@@ -64,8 +75,9 @@ def _status_colorized(field, fields):
 
 
 def _priority(field, fields):
-    if field['name'] not in ('Undefined', 'undefined'):
-        return field['name']
+    name = field['name']
+    if name not in _undefined_names:
+        return name
     return None
 
 
@@ -76,17 +88,18 @@ def _reporter(field, fields):
 
 
 def _created_updated(field, fields):
+    updated = fields['updated']
     created = pretty_date(field)
-    if field != fields['updated']:
-        updated = pretty_date(fields['updated'])
-        return f'{created} (Updated {updated})'
-    return created
+    if field == updated:
+        return created
+    return f'{created} (Updated {pretty_date(updated)})'
 
 
 def _votes(field, fields):
-    if field['votes'] in (0, '0'):
+    votes = field['votes']
+    if votes in _zero_votes:
         return None
-    return str(field['votes'])
+    return str(votes)
 
 
 # these can functions can be referenced in custom user
@@ -285,20 +298,17 @@ _quiet_fields = [
     'workratio'
 ]
 
-_quiet_fields_applied = False
-
-
-if not _quiet_fields_applied:
-    _quiet_fields_applied = True
-    for field in _quiet_fields:
-        val = {'id': field, 'name': field, 'display': False}
-        _base_fields.append(val)
+# Base field definitions by id.  Quiet fields replace any entry
+# above with the same id, but keep its position.
+_base_field_map = {field['id']: field for field in _base_fields}
+_base_field_map.update({field: {'id': field, 'name': field, 'display': False} for field in _quiet_fields})
+_base_field_map = MappingProxyType(_base_field_map)
 
 
 # These are fields we should never provide
 # custom rendering for; they are inherently
 # complicated or positional.
-_ignore_fields = [
+_ignore_fields = frozenset([
     'attachment',
     'comment',
     'description',
@@ -307,10 +317,57 @@ _ignore_fields = [
     'subtasks',
     'summary',
     'thumbnail'
-]
+])
+
+
+# What apply_field_renderers() turns each field definition into, so
+# rendering doesn't have to pick apart the definition for every field
+# of every issue.  'renderer' depends on 'kind':
+_HIDDEN = 0      # never displayed (display: False, or disabled)
+_STRING = 1      # str(field)
+_RENDERER = 2    # renderer(field, fields)
+_CODE = 3        # renderer is a code snippet for eval_custom_field
+_INVALID = 4     # renderer is the error text for an unknown renderer
+
+
+# The first seven attributes mirror the keys of a field definition
+# (see _base_fields); 'display' keeps the definition's own value (e.g.
+# 'name_list') so the config can still be reported or written back
+# out.  'padded' caches the name padded to the most recently added
+# widths; see _padded_name().
+class FieldConfig:
+    __slots__ = ('id', 'name', 'display', 'code', 'verbose', 'immutable', 'disabled', 'kind', 'renderer', 'padded')
+
+    def __init__(self, id, name, display=None, code=None, verbose=False, immutable=False, disabled=False):
+        self.id = id
+        self.name = name
+        self.display = display
+        self.code = code
+        self.verbose = verbose
+        self.immutable = immutable
+        self.disabled = disabled
+        self.kind = _STRING
+        self.renderer = None
+        self.padded = {}
+
+    def __repr__(self):
+        return f'FieldConfig({self.id!r}, {self.name!r}, display={self.display!r})'
+
+
+_definition_keys = ('id', 'name', 'display', 'code', 'verbose', 'immutable', 'disabled')
+_max_padded_widths = 4
 
 
 _fields = None
+# (field key, FieldConfig) pairs in display order; rebuilt with _fields
+_render_order = ()
+# Render tables built from _render_order, keyed by (verbose, allow_code);
+# see _get_render_table()
+_render_tables = {}
+
+
+# Compiled code snippets, keyed by their source
+_code_cache = {}
 
 
 def eval_custom_field(__code__, field, fields):
@@ -327,39 +384,76 @@ def eval_custom_field(__code__, field, fields):
     # __code__: is inline in your config and can reference field
     if field is None or not field:
         return None
-    if '__code__' in __code__:
-        raise ValueError('Reserved keyword in code snippet')
+    code = _code_cache.get(__code__)
+    if code is None:
+        if '__code__' in __code__:
+            raise ValueError('Reserved keyword in code snippet')
+        try:
+            code = compile(str(__code__), '<trolly-field>', 'eval')
+        except Exception as e:
+            return str(e)
+        _code_cache[__code__] = code
     try:
-        return eval(str(__code__))
+        return eval(code, globals(), {'field': field, 'fields': fields})
     except Exception as e:
         return str(e)
 
 
-# kinda slow but...
 def apply_field_renderers(custom_field_defs=None):
     global _fields
-    base_fields = OrderedDict()
-    custom_fields = OrderedDict()
-    ret = OrderedDict()
+    global _render_order
+    global _render_tables
+
+    fields = _build_fields(custom_field_defs)
+    for key in fields:
+        fields[key] = _field_config(fields[key])
+    _fields = MappingProxyType(fields)
+    _render_order = tuple(fields.items())
+    _render_tables = {}
+
+
+# Rendering before apply_field_renderers() has been called uses the
+# base fields.
+def _get_fields():
+    if _fields is None:
+        apply_field_renderers()
+    return _fields
+
+
+# Once verbose and allow_code are known, the way each field renders is
+# fixed, so resolve it once per combination: a tuple of
+# (field key, FieldConfig, render function) for every field which can
+# be displayed, where render function takes (field, fields).
+def _get_render_table(verbose, allow_code):
+    _get_fields()
+    table_key = (bool(verbose), bool(allow_code))
+    table = _render_tables.get(table_key)
+    if table is None:
+        table = tuple((field_key, field_config, _render_function(field_config, allow_code))
+                      for field_key, field_config in _render_order
+                      if field_config.kind != _HIDDEN and (verbose or not field_config.verbose))
+        _render_tables[table_key] = table
+    return table
+
+
+def _build_fields(custom_field_defs):
+    base_fields = _base_field_map
+    custom_fields = {}
+    ret = {}
 
     if not custom_field_defs:
-        for field in _base_fields:
+        for field in base_fields.values():
             if field['id'] in _ignore_fields:
                 continue
             ret[field['id']] = field
-        _fields = ret
-        return
-
-    # First go through base fields
-    for field in _base_fields:
-        base_fields[field['id']] = field
+        return ret
 
     # reorder
     for field in custom_field_defs:
         if field['id'] in _ignore_fields:
             continue
-        if field['id'] in base_fields:
-            bf = base_fields[field['id']]
+        bf = base_fields.get(field['id'])
+        if bf is not None:
             if 'immutable' in bf and bf['immutable']:
                 custom_fields[field['id']] = bf
                 continue
@@ -376,68 +470,138 @@ def apply_field_renderers(custom_field_defs=None):
     for key in custom_fields:
         ret[key] = custom_fields[key]
 
-    _fields = ret
+    return ret
 
 
-def render_field_data(field_key, field, fields, verbose=False, allow_code=False):
-    if field_key not in _fields:
-        return None
-    if not field:
-        return None
-    field_config = _fields[field_key]
+def _field_config(field):
+    definition = {key: field[key] for key in _definition_keys if key in field}
+    # 'name' is only needed to print the field, so hiding a field with
+    # just {"id": ..., "display": false} is fine
+    definition.setdefault('name', definition['id'])
+    config = FieldConfig(**definition)
+    config.verbose = config.verbose is True
 
-    if 'verbose' in field_config:
-        if field_config['verbose'] is True and not verbose:
-            return None
-    if 'disabled' in field_config and field_config['disabled'] is True:
-        return None
+    if config.disabled is True:
+        config.kind = _HIDDEN
     # display supersedes code
-    if 'display' in field_config:
-        r_info = field_config['display']
+    elif 'display' in field:
+        r_info = config.display
         if isinstance(r_info, bool):
-            return None if not r_info else str(field)
-        if isinstance(r_info, str):
-            if r_info not in _field_renderers:
-                return f'<invalid renderer: {r_info} for {field_key}>'
+            config.kind = _STRING if r_info else _HIDDEN
+        elif isinstance(r_info, str):
+            config.renderer = _field_renderers.get(r_info)
+            if config.renderer is None:
+                config.kind = _INVALID
+                config.renderer = f'<invalid renderer: {r_info} for {config.id}>'
             else:
-                return _field_renderers[r_info](field, fields)
+                config.kind = _RENDERER
         else:
-            return r_info(field, fields)
-    if 'code' in field_config and allow_code:
-        return eval_custom_field(field_config['code'], field, fields)
+            config.kind = _RENDERER
+            config.renderer = r_info
+    elif 'code' in field:
+        config.kind = _CODE
+        config.renderer = config.code
+    return config
+
+
+def render_field_data(field_key, field, fields, verbose=False, allow_code=False):
+    field_config = _get_fields().get(field_key)
+    if field_config is None:
+        return None
+    return _render_field(field_config, field, fields, verbose, allow_code)
+
+
+def _render_field(field_config, field, fields, verbose, allow_code):
+    if not field:
+        return None
+    if field_config.verbose and not verbose:
+        return None
+    if field_config.kind == _HIDDEN:
+        return None
+    return _render_function(field_config, allow_code)(field, fields)
+
+
+def _as_string(field, fields):
     return str(field)
 
 
+def _render_function(field_config, allow_code):
+    kind = field_config.kind
+    if kind == _RENDERER:
+        return field_config.renderer
+    if kind == _CODE and allow_code:
+        return partial(eval_custom_field, field_config.renderer)
+    if kind == _INVALID:
+        text = field_config.renderer
+        return lambda field, fields: text
+    return _as_string
+
+
 def field_ordering():
-    return [_fields.keys()]
+    return [_get_fields().keys()]
 
 
-def max_field_width(issue, verbose, allow_code):
-    width = 0
+# Render everything displayable in an issue once, returning a list
+# of (FieldConfig, rendered value) pairs in display order.  Callers
+# that need both the width and the output should render once and pass
+# the result to rendered_field_width() and render_issue_fields().
+def render_fields(issue, verbose=False, allow_code=False):
+    return _render_fields(_get_render_table(verbose, allow_code), issue)
+
+
+def _render_fields(render_table, issue):
+    rendered = []
 
-    for field_key in _fields:
-        if field_key not in issue:
+    for field_key, field_config, render in render_table:
+        field = issue.get(field_key)
+        if not field:
             continue
-        field = issue[field_key]
-        val = render_field_data(field_key, field, issue, verbose, allow_code)
+        val = render(field, issue)
         if not val:
             continue
-        width = max(width, len(_fields[field_key]['name']))
-    return width
+        rendered.append((field_config, val))
+    return rendered
 
 
-def render_issue_fields(issue, verbose=False, allow_code=False, width=None):
-    global _fields
+def rendered_field_width(rendered):
+    return max((len(field_config.name) for field_config, val in rendered), default=0)
+
+
+def _padded_name(field_config, width):
+    padded = field_config.padded.get(width)
+    if padded is None:
+        padded = field_config.name.ljust(width)
+        if len(field_config.padded) >= _max_padded_widths:
+            # dicts keep insertion order; drop the oldest width
+            del field_config.padded[next(iter(field_config.padded))]
+        field_config.padded[width] = padded
+    return padded
+
+
+def max_field_width(issue, verbose, allow_code):
+    return rendered_field_width(render_fields(issue, verbose, allow_code))
+
 
+def render_issue_fields(issue, verbose=False, allow_code=False, width=None, rendered=None):
+    if rendered is None:
+        rendered = render_fields(issue, verbose, allow_code)
     if not width:
-        width = max_field_width(issue, verbose, allow_code)
+        width = rendered_field_width(rendered)
 
-    for field_key in _fields:
-        if field_key not in issue:
-            continue
-        field = issue[field_key]
-        val = render_field_data(field_key, field, issue, verbose, allow_code)
-        if not val:
-            continue
-        vsep_print(' ', _fields[field_key]['name'], width, val)
-        # print(_fields[field_key]['name'].ljust(width), sep, val)
+    for field_config, val in rendered:
+        vsep_print(' ', _padded_name(field_config, width), width, val)
+
+
+# Render several issues (raw JIRA issues, with 'key' and 'fields'),
+# each headed by its key and summary as in print_issue, all aligned to
+# a single width.
+def render_issues(issues, verbose=False, allow_code=False):
+    render_table = _get_render_table(verbose, allow_code)
+    rendered = [(issue, _render_fields(render_table, issue['fields'])) for issue in issues]
+    width = max((max(len(issue['key']), rendered_field_width(issue_rendered)) for issue, issue_rendered in rendered), default=0)
+
+    for issue, issue_rendered in rendered:
+        vsep_print(' ', issue['key'], width, issue['fields']['summary'])
+        for field_config, val in issue_rendered:
+            vsep_print(' ', _padded_name(field_config, width), width, val)
+        print()
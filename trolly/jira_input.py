@@ -22,8 +22,9 @@ def transmogrify_input(**args):
     output = {}
     for field in args:
         value = args[field]
-        if field in _field_transmogrifiers:
-            output[field] = _field_transmogrifiers[field](field, value)
+        transmogrifier = _field_transmogrifiers.get(field)
+        if transmogrifier is not None:
+            output[field] = transmogrifier(field, value)
         else:
             output[field] = value
     return output